@@ -1,5 +1,20 @@
+import os
+import sys
 from setuptools import setup
 
+# The C tokenisers are optional, terseparse.types falls back to pure Python.
+# Build failures are ignored so installing never depends on a working compiler.
+ext_modules = []
+if sys.version_info[0] >= 3 and os.path.exists('terseparse/_fast.pyx'):
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        pass
+    else:
+        ext_modules = cythonize('terseparse/_fast.pyx')
+        for ext in ext_modules:
+            ext.optional = True
+
 # Load __version__ without importing it (avoids race condition with build)
 exec(open('terseparse/version.py').read())
 
@@ -14,6 +29,7 @@ extras = {
 setup(name='terseparse',
       description='A minimal boilerplate, composeable wrapper for argument parsing',
       packages=['terseparse'],
+      ext_modules=ext_modules,
       version=__version__,
       url='https://github.com/jthacker/terseparse',
       download_url='https://github.com/jthacker/terseparse/archive/v{}.tar.gz'.format(__version__),
@@ -0,0 +1,39 @@
+# cython: language_level=3
+"""Optional C implementations of the tokenisers in terseparse.types"""
+
+
+cpdef list split_list(str val):
+    """Split a string on commas, semi-colons and/or whitespace"""
+    cdef list items = []
+    cdef Py_ssize_t i, start = -1, n = len(val)
+    cdef Py_UCS4 c
+    for i in range(n):
+        c = val[i]
+        if c == u',' or c == u';' or c.isspace():
+            if start != -1:
+                items.append(val[start:i])
+                start = -1
+        elif start == -1:
+            start = i
+    if start != -1:
+        items.append(val[start:n])
+    return items
+
+
+cpdef tuple split_kv(str pair):
+    """Split a key-value pair on the first run of colons and/or equals signs"""
+    cdef Py_ssize_t i, start = -1, end = -1, n = len(pair)
+    cdef Py_UCS4 c
+    for i in range(n):
+        c = pair[i]
+        if c == u'=' or c == u':':
+            if start == -1:
+                start = i
+                end = i + 1
+            elif end == i:
+                end = i + 1
+            else:
+                raise ValueError('too many values in {!r}'.format(pair))
+    if start == -1:
+        return pair, u''
+    return pair[:start], pair[end:]
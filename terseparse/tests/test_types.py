@@ -123,3 +123,149 @@ def test_file():
     t = types.File.rw
     with pytest.raises(ArgumentTypeError):
         t("non-existant-file")
+
+def test_split_list():
+    assert types.split_list('') == []
+    assert types.split_list('a,b,,c') == ['a', 'b', 'c']
+    assert types.split_list('a;b;;c') == ['a', 'b', 'c']
+    assert types.split_list(' a  b\tc ') == ['a', 'b', 'c']
+    assert types.split_list('a, b;c d') == ['a', 'b', 'c', 'd']
+
+def test_split_kv():
+    assert types.split_kv('a') == ('a', '')
+    assert types.split_kv('a:b') == ('a', 'b')
+    assert types.split_kv('a=b') == ('a', 'b')
+    assert types.split_kv('a:=b') == ('a', 'b')
+    assert types.split_kv('a:/b/c') == ('a', '/b/c')
+    with pytest.raises(ValueError):
+        types.split_kv('a:b=c')
+
+def test_Int_one_sided_bounds():
+    t = types.Int.positive
+    assert_conv_fails(t, '-1')
+    assert t('0') == 0
+
+    t = types.Int.negative
+    assert_conv_fails(t, '0')
+    assert t('-1') == -1
+
+def test_Int_hex():
+    t = types.Int()
+    assert t('0xff') == 255
+    assert t('0XFF') == 255
+    assert t('-0x10') == -16
+    assert t('+0x10') == 16
+
+    assert_conv_fails(t, 'ff')
+    assert_conv_fails(t, 'abcd')
+    assert_conv_fails(t, '0x')
+
+def test_Bool():
+    t = types.Bool()
+    assert t('true') is True
+    assert t('True') is True
+    assert t('YES') is True
+    assert t('1') is True
+    assert t('on') is True
+
+    assert t('false') is False
+    assert t('0') is False
+    assert t('') is False
+
+def test_shared_instances():
+    assert types._keyword('a') is types._keyword('a')
+    assert types._keyword('a')('a') == 'a'
+    shared = types.Dict({'a': str}).keys_to_set_type().typ.types[0]
+    assert shared is types._keyword('a')
+    with pytest.raises(AttributeError):
+        shared.description = 'changed'
+    assert types._keyword('a').description == "Matches 'a' and maps it to 'a'"
+
+    assert types.Or('a', 'b').types[0] is not types._keyword('a')
+
+    kw = types.Keyword('a')
+    kw.description = 'changed'
+    assert kw.description == 'changed'
+
+def test_file_instances_not_shared():
+    f = types.File.r
+    f.description = 'config file'
+    assert types.File.r is not f
+    assert types.File.r.description == 'file(r)'
+
+def test_file_modes(tmp_path):
+    path = tmp_path / 'file'
+    path.write_text(u'contents')
+
+    assert types.File.r(str(path)) == str(path)
+    assert types.File.rw(str(path)) == str(path)
+    assert types.File.w(str(path)) == str(path)
+    assert path.read_text() == u'contents'
+
+    new_path = str(tmp_path / 'new-file')
+    assert types.File.w(new_path) == new_path
+    assert_conv_fails(types.File.r, new_path)
+    assert_conv_fails(types.File.w, str(tmp_path / 'missing' / 'file'))
+    assert_conv_fails(types.File.w, str(path / 'file'))
+    assert_conv_fails(types.File.r, str(tmp_path))
+
+def test_List_Int():
+    t = types.List(types.Int(0, 0x10))
+    assert t('1,2,3') == [1, 2, 3]
+    assert t('1 0xF') == [1, 15]
+
+    assert_conv_fails(t, '1,16')
+    assert_conv_fails(t, '1,a')
+
+def test_Set_Str():
+    t = types.Set(types.Str())
+    assert t('a,b a') == set(('a', 'b'))
+
+def test_Or_Int_Str():
+    t = types.Or(types.Int(), types.Str())
+    assert t('abc') == 'abc'
+    assert t('-12') == -12
+    assert t(' 12 ') == 12
+    assert t('0xF') == 15
+    assert t('-') == '-'
+
+def test_fast_tokenisers():
+    _fast = pytest.importorskip('terseparse._fast')
+    for val in ('', 'a,b,,c', 'a;b;;c', ' a  b\tc ', 'a, b;c d', 'a:1,b=2 c'):
+        assert _fast.split_list(val) == types.list_regex.findall(val)
+    for pair in ('a', 'a:b', 'a=b', 'a:=b', 'a:/b/c', ':b', 'a:'):
+        assert _fast.split_kv(pair) == types.split_kv(pair)
+    with pytest.raises(ValueError):
+        _fast.split_kv('a:b=c')
+
+def test_Int_bounds_changed():
+    t = types.Int(0, 10)
+    assert_conv_fails(t, '50')
+    assert t.error_message == 'Value must satisfy: 0 <= val < 10'
+
+    t.maxval = 100
+    assert t('50') == 50
+    assert t.error_message == 'Value must satisfy: 0 <= val < 100'
+    assert types.List(t)('5,50') == [5, 50]
+
+    t.minval = None
+    assert t('-1') == -1
+    assert t.description == 'int(val < 100)'
+
+def test_Or_Keyword_subclass():
+    class CIKeyword(types.Keyword):
+        __slots__ = ()
+
+        def convert(self, val):
+            return types.Keyword.convert(self, val.lower())
+
+    t = types.Or(CIKeyword('auto'), types.Int())
+    assert t('AUTO') == 'auto'
+    assert t('1') == 1
+
+def test_Or_Keyword_changed_key():
+    kw = types.Keyword('a')
+    t = types.Or(kw, types.Int())
+    kw.key = 'b'
+    assert t('b') == 'a'
+    assert_conv_fails(t, 'a')
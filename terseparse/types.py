@@ -2,9 +2,10 @@
 import re
 import logging
 import os
+from functools import partial
 from argparse import ArgumentTypeError
 
-from terseparse.utils import classproperty, rep
+from terseparse.utils import classproperty, lazyproperty, rep
 
 
 log = logging.getLogger('terseparse.types')
@@ -12,12 +13,51 @@ log = logging.getLogger('terseparse.types')
 # Lists of items are separated by commas, semi-colons and/or whitespace
 list_regex = re.compile(r'[^,;\s]+')
 
+# Keys and values are separated by colons and/or equals signs
+kv_regex = re.compile(r'[=:]+')
+
+
+def split_list(val):
+    """Split a string into its list items.
+    Equivalent to list_regex.findall(val). The punctuation separators are
+    mapped onto whitespace so str.split does the scan, avoiding the regex engine.
+    """
+    if ',' in val:
+        val = val.replace(',', ' ')
+    if ';' in val:
+        val = val.replace(';', ' ')
+    return val.split()
+
+
+def split_kv(pair):
+    """Split a key-value pair into a (key, value) tuple.
+    The value is the empty string when no separator is present.
+    Raises ValueError if the pair contains more than one value.
+    """
+    i = pair.find('=')
+    j = pair.find(':')
+    idx = i if i != -1 and (j == -1 or i < j) else j
+    if idx == -1:
+        return pair, ''
+    k, v = pair[:idx], pair[idx + 1:]
+    if '=' in v or ':' in v:
+        # Repeated separators (eg. 'a::b') or too many values
+        k, v = kv_regex.split(pair)
+    return k, v
+
+
+try:
+    from terseparse._fast import split_list, split_kv
+except ImportError:
+    pass
+
 
 class Type(object):
     """ABC for type objects.
     Types are callable, taking a string and converting it
     to their given type. The call method should have no side effects.
     """
+    __slots__ = ()
 
     def __call__(self, val):
         return self.convert(val)
@@ -38,10 +78,12 @@ class Type(object):
 
 class GreedyType(Type):
     """Mixin to indicate that a type will greedily consume arguments."""
+    __slots__ = ()
 
 
 class Keyword(Type):
     """A Keyword maps a string to a static value"""
+    __slots__ = ('name', 'key', 'value', 'description')
 
     def __init__(self, name, *value):
         """Initialize Keywords
@@ -67,10 +109,39 @@ class Keyword(Type):
         return rep(self, 'name', 'value')
 
 
+class _SharedKeyword(Keyword):
+    """A read-only Keyword that can safely be shared between types"""
+    __slots__ = ('_frozen',)
+
+    def __init__(self, name):
+        super(_SharedKeyword, self).__init__(name)
+        self._frozen = True
+
+    def __setattr__(self, attr, val):
+        if getattr(self, '_frozen', False):
+            raise AttributeError('Keyword {!r} is shared and cannot be modified'
+                                 .format(self.key))
+        super(_SharedKeyword, self).__setattr__(attr, val)
+
+
+# Shared Keywords for Dict keys, see Dict.keys_to_set_type
+_keywords = {}
+
+
+def _keyword(name):
+    """Return a shared, read-only Keyword that maps name to itself"""
+    kw = _keywords.get(name)
+    if kw is None:
+        kw = _keywords[name] = _SharedKeyword(name)
+    return kw
+
+
 class Str(Type):
     """Convert string to string
     Use this instad of str, to get a clean type name
     """
+    __slots__ = ('name',)
+
     def __init__(self):
         self.name = 'str'
 
@@ -81,19 +152,48 @@ class Str(Type):
         return rep(self, 'name')
 
 
+TRUE_VALS = frozenset(('true', 't', '1', 'yes', 'y', 'on'))
+
+
 class Bool(Type):
-    """Convert string to bool"""
+    """Convert string to bool
+    Any case of 'true', 't', '1', 'yes', 'y' or 'on' is True, everything else is False
+    """
+    __slots__ = ('name',)
+
     def __init__(self):
         self.name = 'bool'
-        self.true_vals = ('true', 't', '1', 'yes')
 
-    def __init__(self, val):
-        return val.lower() in self.true_vals
+    def convert(self, val):
+        return val in TRUE_VALS or val.lower() in TRUE_VALS
 
     def __repr__(self):
         return rep(self, 'name')
 
 
+def _items_converter(typ):
+    """Return a function that converts a list of strings to values of typ.
+    Str and Int items are converted in bulk, other types one item at a time.
+    """
+    if type(typ) is Str:
+        return partial(map, str)
+    if type(typ) is Int:
+        return partial(_convert_ints, typ)
+    return partial(map, typ)
+
+
+def _convert_ints(typ, items):
+    try:
+        vals = [int(k, 10) for k in items]
+    except ValueError:
+        # Hex or invalid values, let typ parse them or report the error
+        return map(typ, items)
+    out_of_range = typ._out_of_range
+    if out_of_range is not None and any(map(out_of_range, vals)):
+        return map(typ, items)
+    return vals
+
+
 class Set(Type):
     """A Set is a comma separated list of unique values that satisfy the specified type.
     >>> s = Set(Int())
@@ -103,21 +203,26 @@ class Set(Type):
     >>> s('1,1,1,1')
     {1}
     """
+    __slots__ = ('typ', '_convert_items', '_name', '_description')
 
     def __init__(self, typ):
-        self.name = 'set(<{}>)'.format(typ)
-        self.description = 'A set is a comma separated list of unique values ' \
-                'of type <{}>.'.format(typ.name)
         self.typ = typ
+        self._convert_items = _items_converter(typ)
+
+    @lazyproperty
+    def name(self):
+        return 'set(<{}>)'.format(self.typ)
+
+    @lazyproperty
+    def description(self):
+        return 'A set is a comma separated list of unique values ' \
+                'of type <{}>.'.format(self.typ.name)
 
     def convert(self, val):
-        seq = set()
-        for k in list_regex.findall(val):
-            try:
-                seq.add(self.typ(k))
-            except ArgumentTypeError as e:
-                self.fail(val, self.description + '\n' + str(e))
-        return seq
+        try:
+            return set(self._convert_items(split_list(val)))
+        except ArgumentTypeError as e:
+            self.fail(val, self.description + '\n' + str(e))
 
     def __repr__(self):
         return rep(self, 'typ')
@@ -132,21 +237,26 @@ class List(Type):
     >>> l('1,1,1,1')
     [1,1,1,1]
     """
+    __slots__ = ('typ', '_convert_items', '_name', '_description')
 
     def __init__(self, typ):
-        self.name = 'list(<{}>)'.format(typ)
-        self.description = 'A list is a comma separated list of values of type <{}>.' \
-                .format(typ)
         self.typ = typ
+        self._convert_items = _items_converter(typ)
+
+    @lazyproperty
+    def name(self):
+        return 'list(<{}>)'.format(self.typ)
+
+    @lazyproperty
+    def description(self):
+        return 'A list is a comma separated list of values of type <{}>.' \
+                .format(self.typ)
 
     def convert(self, val):
-        seq = list()
-        for k in list_regex.findall(val):
-            try:
-                seq.append(self.typ(k))
-            except ArgumentTypeError as e:
-                self.fail(val, self.description + '\n' + str(e))
-        return seq
+        try:
+            return list(self._convert_items(split_list(val)))
+        except ArgumentTypeError as e:
+            self.fail(val, self.description + '\n' + str(e))
 
     def __repr__(self):
         return rep(self, 'typ')
@@ -175,6 +285,8 @@ class Dict(Type):
     Keys can be specified multiple times, the latest (farthest to right) key's
     value will overwrite previous values.
     """
+    __slots__ = ('validators', '_validator_descriptions', '_name', '_description')
+
     def __init__(self, validator_map):
         """Create a dictonary type from a dictionary of other types
         Args:
@@ -190,15 +302,22 @@ class Dict(Type):
         {'a': None, 'b': 1}
         """
         self.validators = dict(validator_map)
-        v_sorted = sorted(self.validators.items(), key=lambda t: t[0])
-        self.validator_descriptions = ['{}:<{}>'.format(k, v) for k, v in v_sorted]
-        self.name = 'dict({})'.format(', '.join(self.validator_descriptions))
-        self.description = '\nDict options: \n  '
-        self.description += '\n  '.join(self.validator_descriptions)
-        self.kv_regex = re.compile(r'[=:]+')
+
+    @lazyproperty
+    def validator_descriptions(self):
+        v_sorted = sorted(self.validators.items())
+        return ['{}:<{}>'.format(k, v) for k, v in v_sorted]
+
+    @lazyproperty
+    def name(self):
+        return 'dict({})'.format(', '.join(self.validator_descriptions))
+
+    @lazyproperty
+    def description(self):
+        return '\nDict options: \n  ' + '\n  '.join(self.validator_descriptions)
 
     def keys_to_set_type(self):
-        kws = tuple(Keyword(k) for k in self.validators)
+        kws = tuple(_keyword(k) for k in self.validators)
         return Set(Or(*kws))
 
     def convert(self, val):
@@ -211,17 +330,15 @@ class Dict(Type):
 
     def _convert(self, val):
         obj = {}
-        for pair in list_regex.findall(val):
-            pair = self.kv_regex.split(pair)
-            if len(pair) == 1:
-                k, v = pair[0], ''
-            else:
-                k, v = pair
-            assert k in self.validators
-            val = self.validators[k](v)
+        get_validator = self.validators.get
+        for pair in split_list(val):
+            k, v = split_kv(pair)
+            validator = get_validator(k)
+            if validator is None:
+                raise AssertionError(k)
+            val = validator(v)
             if k in obj:
-                log.warn('key: {!r} overwritten '
-                         'new: {!r} old: {!r}'.format(k, val, obj[k]))
+                log.warning('key: %r overwritten new: %r old: %r', k, val, obj[k])
             obj[k] = val
         return obj
 
@@ -237,8 +354,16 @@ MODE_STRS = {
     'w': 'writable',
     'r+': 'readable and writeable'}
 
+FILE_MODES = {
+    'r': os.R_OK,
+    'w': os.W_OK,
+    'r+': os.R_OK | os.W_OK
+}
+
 
 class File(Type):
+    __slots__ = ('name', 'mode', 'mode_str', 'description')
+
     @classproperty
     def r(cls):
         return cls('r')
@@ -258,11 +383,16 @@ class File(Type):
         self.description = 'file({})'.format(mode)
 
     def convert(self, val):
-        try:
-            with open(val, self.mode):
-                return val
-        except IOError:
+        # Check permissions instead of opening the file, opening it with mode 'w'
+        # would truncate it
+        if os.path.exists(val):
+            ok = not os.path.isdir(val) and os.access(val, FILE_MODES[self.mode])
+        else:
+            parent = os.path.dirname(val) or '.'
+            ok = self.mode == 'w' and os.path.isdir(parent) and os.access(parent, os.W_OK)
+        if not ok:
             self.fail(val, 'Must be a {} file'.format(self.mode_str))
+        return val
 
     def __repr__(self):
         return rep(self, 'mode')
@@ -276,6 +406,8 @@ DIR_MODES = {
 
 
 class Dir(File):
+    __slots__ = ()
+
     def __init__(self, mode):
         self.name = 'dir'
         self.mode = DIR_MODES[mode]
@@ -291,6 +423,19 @@ class Dir(File):
         return rep(self, 'mode')
 
 
+def _range_check(minval, maxval):
+    """Return a predicate that is True for values outside minval <= val < maxval.
+    Returns None when neither bound is set.
+    """
+    if minval is not None and maxval is not None:
+        return lambda val: val < minval or val >= maxval
+    elif minval is not None:
+        return lambda val: val < minval
+    elif maxval is not None:
+        return lambda val: val >= maxval
+    return None
+
+
 class Int(Type):
     """Int: Integer parseing class that supports range restrictions
     Supports automatic parsing of base 10 and 16 characters
@@ -301,6 +446,9 @@ class Int(Type):
     >>> Int()('01234')
     1234
     """
+    __slots__ = ('name', '_minval', '_maxval', '_out_of_range', '_domain', '_description',
+                 '_error_message')
+
     @classproperty
     def u8(cls):
         obj = cls(0, 2**8)
@@ -334,49 +482,101 @@ class Int(Type):
         """Create an Integer that satisfies the requirements minval <= val < maxval
         """
         self.name = 'int'
-        self.minval = minval
-        self.maxval = maxval
-        domain = ''
+        self._minval = minval
+        self._maxval = maxval
+        self._out_of_range = _range_check(minval, maxval)
+
+    @property
+    def minval(self):
+        return self._minval
+
+    @minval.setter
+    def minval(self, val):
+        self._minval = val
+        self._bounds_changed()
+
+    @property
+    def maxval(self):
+        return self._maxval
+
+    @maxval.setter
+    def maxval(self, val):
+        self._maxval = val
+        self._bounds_changed()
+
+    def _bounds_changed(self):
+        """Rebuild the range check and drop descriptions made from the old bounds"""
+        self._out_of_range = _range_check(self._minval, self._maxval)
+        for attr in ('_domain', '_description', '_error_message'):
+            if hasattr(self, attr):
+                delattr(self, attr)
+
+    @lazyproperty
+    def domain(self):
+        minval, maxval = self.minval, self.maxval
         if minval is not None and maxval is not None:
-            domain = '{} <= val < {}'.format(minval, maxval)
+            return '{} <= val < {}'.format(minval, maxval)
         elif minval is not None:
-            domain = '{} <= val'.format(minval)
+            return '{} <= val'.format(minval)
         elif maxval is not None:
-            domain = 'val < {}'.format(maxval)
-        self.description = 'int({})'.format(domain) if domain else 'int'
-        self.error_message = 'Value must satisfy: {}'.format(domain) if domain else ''
+            return 'val < {}'.format(maxval)
+        return ''
+
+    @lazyproperty
+    def description(self):
+        return 'int({})'.format(self.domain) if self.domain else 'int'
+
+    @lazyproperty
+    def error_message(self):
+        return 'Value must satisfy: {}'.format(self.domain) if self.domain else ''
 
     def convert(self, val_str):
         try:
             val = self._convert(val_str)
-        except (ValueError, AssertionError):
+        except ValueError:
             self.fail(val_str, self.error_message)
-        if (self.minval is not None and val < self.minval) or (
-                self.maxval is not None and val >= self.maxval):
+        out_of_range = self._out_of_range
+        if out_of_range is not None and out_of_range(val):
             self.fail(val_str, self.error_message)
         return val
 
     def _convert(self, val):
         # Not using int(val, 0) because that parses '011' to 9 (in octal), which
         # is a bit misleading if you aren't use to the convention.
-        try:
-            return int(val, 10)
-        except ValueError:
-            # have to check for '0x' otherwise 'abcd' would parse to 4391, which
-            # on first glance does not appear to be a number
-            assert '0x' in val.lower()
+        # Hex requires the '0x' prefix otherwise 'abcd' would parse to 43981,
+        # which on first glance does not appear to be a number
+        if val.strip().lstrip('+-')[:2] in ('0x', '0X'):
             return int(val, 16)
+        return int(val, 10)
 
     def __repr__(self):
         return rep(self, 'minval', 'maxval')
 
 
+def _prematch(typ):
+    """Return a cheap predicate that is False for values typ would reject.
+    Returns None when every value has to be tried.
+    """
+    if type(typ) in (Keyword, _SharedKeyword):
+        return lambda val: val == typ.key
+    if type(typ) is Int:
+        return _maybe_int
+    return None
+
+
+def _maybe_int(val):
+    # Decimal and '0x' prefixed values both start with a digit after the sign
+    return val.strip().lstrip('+-')[:1].isdigit()
+
+
 class Or(Type):
     """Combine types in a shortcircuit fashion.
     The first type to match wins.
     If an Or is one of the types then its nested types are flattened.
     Automatically convert string to Keywords
     """
+    __slots__ = ('types', '_matchers', '_name', '_description')
+
     def __init__(self, *types):
         _types = []
         for typ in types:
@@ -386,13 +586,21 @@ class Or(Type):
                 if isinstance(typ, str):
                     typ = Keyword(typ)
                 _types.append(typ)
-
-        self.name = '|'.join(map(str, _types))
-        self.description = ' or '.join(t.description for t in _types)
         self.types = _types
+        self._matchers = [(_prematch(t), t) for t in _types]
+
+    @lazyproperty
+    def name(self):
+        return '|'.join(map(str, self.types))
+
+    @lazyproperty
+    def description(self):
+        return ' or '.join(t.description for t in self.types)
 
     def convert(self, val):
-        for t in self.types:
+        for matches, t in self._matchers:
+            if matches is not None and not matches(val):
+                continue
             try:
                 return t(val)
             except ArgumentTypeError:
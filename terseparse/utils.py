@@ -17,6 +17,32 @@ def classproperty(func):
     return ClassPropertyDescriptor(func)
 
 
+class LazyPropertyDescriptor(object):
+    """Computes an attribute on first access and stores it on the instance.
+    The value is kept in '_' + name, assigning to the property overrides it.
+    """
+    def __init__(self, fget):
+        self.fget = fget
+        self.attr = '_' + fget.__name__
+
+    def __get__(self, obj, klass=None):
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.attr)
+        except AttributeError:
+            val = self.fget(obj)
+            setattr(obj, self.attr, val)
+            return val
+
+    def __set__(self, obj, val):
+        setattr(obj, self.attr, val)
+
+
+def lazyproperty(func):
+    return LazyPropertyDescriptor(func)
+
+
 def rep(obj, *attrs, **kwargs):
     """Create a repr of a property based class quickly
     Args: